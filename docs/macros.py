@@ -5,23 +5,29 @@ Mkdocs-Macros Module
 https://mkdocs-macros-plugin.readthedocs.io/en/latest/macros/
 """
 
+from datetime import datetime
+from functools import lru_cache
+
 from markupsafe import Markup
 
 
+# Acronym Template (pre-marked as safe HTML)
+ACRONYM_OPEN = Markup("(<strong>")
+ACRONYM_CLOSE = Markup("</strong>)")
+
+
+@lru_cache(maxsize=1024)
 def format_acronym(text):
     """
     Formats acronyms by wrapping each first letter in parentheses and <strong> tags.
     """
 
     # Extract the first letter and the rest of the word
-    first_letter = text[0]
-    rest_of_text = text[1:]
+    first_letter = Markup(text[0])
+    rest_of_text = Markup(text[1:])
 
-    # Construct the formatted acronym
-    formatted_text = f"(<strong>{first_letter}</strong>){rest_of_text}"
-
-    # Markup to mark the string as safe HTML
-    return Markup(formatted_text)
+    # Construct the formatted acronym (Markup + Markup stays safe HTML)
+    return ACRONYM_OPEN + first_letter + ACRONYM_CLOSE + rest_of_text
 
 
 def define_env(env):
@@ -33,11 +39,12 @@ def define_env(env):
     - variables: the dictionary that contains the environment variables
     """
 
+    # Computed once per build (not per page)
+    year = datetime.now().year
+
     @env.macro
     def current_year():
-        from datetime import datetime
-
-        return datetime.now().year
+        return year
 
     @env.macro
     def url(url):
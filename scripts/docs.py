@@ -1,19 +1,22 @@
 from pathlib import Path
 import argparse
-import subprocess
+import os
+import shlex
 from functools import partial
 
 # Define commands for various operations
-CMD_DEV = "python -m mkdocs serve --dev-addr 0.0.0.0:8056"
-CMD_DEPLOY = "python -m mkdocs gh-deploy --force"
+CMD_DEV = ["python", "-m", "mkdocs", "serve", "--dev-addr", "0.0.0.0:8056"]
+CMD_DEPLOY = ["python", "-m", "mkdocs", "gh-deploy", "--force"]
+FLAGS_DIRTY = ["--dirty"]  # Only re-build the pages that changed
 
 
-def execute_command(docs_dir: Path, command: str) -> None:
-    """Execute a command in the specified directory."""
+def execute_command(docs_dir: Path, command: list[str]) -> None:
+    """Replace the current process with a command run in the specified directory."""
+    os.chdir(docs_dir)
     try:
-        subprocess.run(command, cwd=docs_dir, check=True, shell=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing command '{command}': {e}")
+        os.execvp(command[0], command)
+    except OSError as e:
+        print(f"Error executing command '{shlex.join(command)}': {e}")
 
 
 def get_args() -> argparse.Namespace:
@@ -22,6 +25,9 @@ def get_args() -> argparse.Namespace:
     parser.add_argument(
         "-gh", "--github", action="store_true", help="Deploy to GitHub pages"
     )
+    parser.add_argument(
+        "--fresh", action="store_true", help="Re-build every page on changes"
+    )
 
     # Parse arguments
     return parser.parse_args()
@@ -34,6 +40,7 @@ def main(docs_dir: Path):
     ### Usage
 
     - **Dev Docs**: `python docs.py`
+    - **Dev Docs (Full Re-Build)**: `python docs.py --fresh`
     - **Deploy to GitHub**: `python docs.py -gh`
     """
 
@@ -46,13 +53,15 @@ def main(docs_dir: Path):
     # Determine which command to run based on arguments
     if args.github:
         command(CMD_DEPLOY)
-    else:
+    elif args.fresh:
         command(CMD_DEV)
+    else:
+        command(CMD_DEV + FLAGS_DIRTY)
 
 
 if __name__ == "__main__":
     # Base Directory
-    base_dir = Path(__file__).resolve().parents[1]
+    base_dir = Path(os.path.abspath(__file__)).parents[1]
     docs_dir = base_dir / "docs"
 
     # Execute Command
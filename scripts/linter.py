@@ -1,43 +1,113 @@
+import os
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import time
 
 # Watch Dog
 import watchdog.events
-import watchdog.observers
 
+# OS-native file events (never fall back to stat() polling)
+if sys.platform == "linux":
+    from watchdog.observers.inotify import InotifyObserver as Observer
+elif sys.platform == "darwin":
+    from watchdog.observers.fsevents import FSEventsObserver as Observer
+elif sys.platform == "win32":
+    from watchdog.observers.read_directory_changes import WindowsApiObserver as Observer
+else:
+    from watchdog.observers import Observer
 
-def shell_cmd(name: str, cmd: str, check: bool = True) -> None:
+
+def shell_cmd(name: str, cmd: list[str], check: bool = True) -> None:
     """
-    Run a shell command and print the name of the command being executed.
+    Run a command and print the name of the command being executed.
     """
     print(f"Running... <{name}>")
     try:
-        subprocess.run(cmd, shell=True, check=check)
+        subprocess.run(cmd, check=check)
     except subprocess.CalledProcessError:
         print(f"Error while running {name}")
     # Add Space
     print((72 * "~") + "\n")
 
 
-def run_linters_and_formatters(path: str) -> None:
+# Mypy Daemon
+CMD_DMYPY = ["python", "-m", "mypy.dmypy"]
+
+# Checkers don't touch the files, so they can run side by side
+CHECK_POOL = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+
+
+def check_cmd(name: str, cmd: list[str], check: bool = True) -> str:
+    """
+    Run a command capturing its output, and return the report to print.
+    """
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    report = [f"Running... <{name}>", result.stdout + result.stderr]
+    if check and result.returncode != 0:
+        report.append(f"Error while running {name}")
+    # Add Space
+    report.append((72 * "~") + "\n")
+    return "\n".join(report)
+
+
+def run_linters_and_formatters(*paths: str | Path, daemon: bool = False) -> None:
     """
-    Run linters and formatters on the specified path.
+    Run linters and formatters on the specified path(s), one process per tool.
+
+    With `daemon`, mypy is checked through the running `dmypy` daemon and pyright
+    is skipped (see `start_daemons`).
     """
+    files = [str(path) for path in paths]
+    mypy_cmd = ["python", "-m", "mypy", *files]
+    if daemon:
+        mypy_cmd = CMD_DMYPY + ["run", "--", *files]
+
     # Formatters
-    shell_cmd("ssort", f"python -m ssort {path}")
-    shell_cmd("isort", f"python -m isort --profile black {path}")
-    shell_cmd("black", f"python -m black {path}")
-    shell_cmd("ruff-format", f"python -m ruff format {path}")
+    shell_cmd("ssort", ["python", "-m", "ssort", *files])
+    shell_cmd("isort", ["python", "-m", "isort", "--profile", "black", *files])
+    shell_cmd("black", ["python", "-m", "black", *files])
+    shell_cmd("ruff-format", ["python", "-m", "ruff", "format", *files])
 
     # Checkers
-    # run_shell_command("bandit", f"python -m bandit -r {path_to_watch}")
-    shell_cmd("pyright", f"python -m pyright {path}")
-    shell_cmd("mypy", f"python -m mypy {path}")
-    shell_cmd("ruff-check", f"python -m ruff check {path}")
+    # check_cmd("bandit", ["python", "-m", "bandit", "-r", *files])
+    checkers = [
+        CHECK_POOL.submit(check_cmd, "mypy", mypy_cmd),
+        CHECK_POOL.submit(
+            check_cmd, "ruff-check", ["python", "-m", "ruff", "check", *files]
+        ),
+        # Quality
+        CHECK_POOL.submit(
+            check_cmd, "pylint", ["python", "-m", "pylint", *files], check=False
+        ),
+    ]
+    if not daemon:
+        checkers.append(
+            CHECK_POOL.submit(check_cmd, "pyright", ["python", "-m", "pyright", *files])
+        )
+    for checker in as_completed(checkers):
+        print(checker.result())
 
-    # Quality
-    shell_cmd("pylint", f"python -m pylint {path}", check=False)
+
+def start_daemons(paths: list[Path]) -> subprocess.Popen:
+    """
+    Start the long-lived checkers: the `dmypy` daemon, and `pyright --watch`
+    (which re-checks and prints on its own whenever a file changes).
+    """
+    subprocess.run(CMD_DMYPY + ["start"], check=False)
+    return subprocess.Popen(
+        ["python", "-m", "pyright", "--watch", *map(str, paths)],
+        start_new_session=True,
+    )
+
+
+def stop_daemons(pyright_watch: subprocess.Popen) -> None:
+    """Stop the long-lived checkers."""
+    pyright_watch.terminate()
+    pyright_watch.wait()
+    subprocess.run(CMD_DMYPY + ["stop"], check=False)
 
 
 class Handler(watchdog.events.PatternMatchingEventHandler):
@@ -55,38 +125,74 @@ class Handler(watchdog.events.PatternMatchingEventHandler):
             # After Event - Do Something ...
     """
 
+    # Debounce (seconds)
+    poll_interval: float = 0.3
+    settle_delay: float = 0.25
+
     def __init__(self):
         watchdog.events.PatternMatchingEventHandler.__init__(
             self,
             patterns=["*.py"],  # File Types
+            ignore_patterns=["*/__pycache__/*", "*/.git/*", "*~*"],
             ignore_directories=True,
             case_sensitive=False,
         )
+        # Pending Paths => Last Event Time
+        self._pending: dict[str, float] = {}
+        self._lock = threading.Lock()
 
-    def on_modified(self, event):
-        path_to_watch = event.src_path
-        print(f"""Fixing... { path_to_watch }""")
+        # Drain Thread
+        drainer = threading.Thread(target=self._drain, daemon=True)
+        drainer.start()
 
-        run_linters_and_formatters(path_to_watch)
+    def on_modified(self, event):
+        with self._lock:
+            self._pending[event.src_path] = time.monotonic()
+
+    def _pop_settled(self) -> list[str]:
+        """Pop the paths that have not changed within `settle_delay`."""
+        now = time.monotonic()
+        with self._lock:
+            settled = [
+                path
+                for path, last_event in self._pending.items()
+                if now - last_event >= self.settle_delay
+            ]
+            for path in settled:
+                del self._pending[path]
+        return settled
+
+    def _drain(self):
+        """Lint all the settled paths together, once per burst of events."""
+        while True:
+            time.sleep(self.poll_interval)
+            paths_to_watch = self._pop_settled()
+            if paths_to_watch:
+                for path_to_watch in paths_to_watch:
+                    print(f"""Fixing... { path_to_watch }""")
+                run_linters_and_formatters(*paths_to_watch, daemon=True)
 
 
 def server_linter(base_dir, all_folders):
     """Watch Folders"""
 
+    # Long-Lived Checkers
+    pyright_watch = start_daemons([base_dir / folder for folder in all_folders])
+
     # Watchdog Handler
     event_handler = Handler()
-    observer = watchdog.observers.Observer()
+    observer = Observer()
     for folder in all_folders:
         observer.schedule(event_handler, path=base_dir / folder, recursive=True)
     observer.start()
 
     # Run "Server"
     try:
-        while True:
-            time.sleep(5)
+        observer.join()
     except KeyboardInterrupt:
         observer.stop()
-    observer.join()
+        observer.join()
+    stop_daemons(pyright_watch)
 
 
 def run_linter(base_dir, all_folders):
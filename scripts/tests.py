@@ -1,22 +1,26 @@
-import subprocess
+import os
+import shlex
 from pathlib import Path
 import argparse
 import shutil
 
 # Define the commands
-CMD_MAIN = "python main.py"
-CMD_INIT = "spoc-init"
-
-
-def execute_command(the_dir: Path, command: str, params: str = ""):
-    """Execute a shell command with optional parameters."""
+CMD_MAIN = ["python", "main.py"]
+CMD_INIT = ["spoc-init"]
+
+
+def execute_command(
+    the_dir: Path, command: list[str], params: list[str] | None = None
+):
+    """Replace the current process with a command (with optional parameters)."""
+    full_command = command + (params or [])
+    # Optional: Print the command being executed
+    print(f"Executing: {shlex.join(full_command)}\n", flush=True)
+    os.chdir(the_dir)
     try:
-        full_command = f"{command} {params}".strip()
-        # Optional: Print the command being executed
-        print(f"Executing: {full_command}\n")
-        subprocess.run(full_command, cwd=the_dir, shell=True, check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing command '{command}': {e}")
+        os.execvp(full_command[0], full_command)
+    except OSError as e:
+        print(f"Error executing command '{shlex.join(command)}': {e}")
 
 
 def main():
@@ -38,7 +42,7 @@ def main():
     args = parser.parse_args()
 
     # Determine which command to run
-    params = " ".join(args.args or [])
+    params = args.args or []
     if args.name:
         match args.name:
             case "spoc":
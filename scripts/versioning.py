@@ -7,12 +7,14 @@ import subprocess
 # Define the path to your __about__.py file
 ABOUT_FILE = Path("src/spoc/__about__.py")
 
+# Matches: __version__ = "x.y.z"
+VERSION_RE = re.compile(r"__version__ = ['\"]([^'\"]*)['\"]")
+
 
 def read_version(file_path):
     """Read the current version from __about__.py."""
-    with open(file_path, "r") as f:
-        content = f.read()
-    match = re.search(r"__version__ = ['\"]([^'\"]*)['\"]", content)
+    content = file_path.read_text()
+    match = VERSION_RE.search(content)
     if match:
         return match.group(1)
     raise ValueError("Version not found in __about__.py")
@@ -20,15 +22,9 @@ def read_version(file_path):
 
 def write_version(file_path, new_version):
     """Write the new version to __about__.py."""
-    with open(file_path, "r") as f:
-        content = f.read()
-    new_content = re.sub(
-        r"__version__ = ['\"]([^'\"]*)['\"]",
-        f'''__version__ = "{new_version}"''',
-        content,
-    )
-    with open(file_path, "w") as f:
-        f.write(new_content)
+    content = file_path.read_text()
+    new_content = VERSION_RE.sub(f'''__version__ = "{new_version}"''', content)
+    file_path.write_text(new_content)
     print(f"Updated version to {new_version}")
 
 
@@ -40,16 +40,11 @@ class MyFramework(spoc.Base):
 ```
 """
 
-# Core Tools
-from .components import Components
-
-# Import Tools
-from .importer.base import search_object
-from .importer.frozendict import FrozenDict as frozendict
-from .importer.tools import get_fields
-from .installer import start_project
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Singleton Base Class
 from .singleton import Singleton as Base
-from .workers import BaseProcess, BaseServer, BaseThread
 
 try:
     # Frame Work
@@ -65,6 +60,45 @@ try:
 except ImportError:
     pass
 
+if TYPE_CHECKING:
+    from .components import Components
+    from .importer.base import search_object
+    from .importer.frozendict import FrozenDict as frozendict
+    from .importer.tools import get_fields
+    from .installer import start_project
+    from .workers import BaseProcess, BaseServer, BaseThread
+
+# Lazy Tools => (module, attribute)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    # Core Tools
+    "Components": (".components", "Components"),
+    "start_project": (".installer", "start_project"),
+    # Import Tools
+    "frozendict": (".importer.frozendict", "FrozenDict"),
+    "get_fields": (".importer.tools", "get_fields"),
+    "search_object": (".importer.base", "search_object"),
+    # Workers
+    "BaseProcess": (".workers", "BaseProcess"),
+    "BaseServer": (".workers", "BaseServer"),
+    "BaseThread": (".workers", "BaseThread"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the rarely used tools on first access (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazy tools."""
+    return sorted([*globals(), *_LAZY_IMPORTS])
+
+
 __all__ = (
     # Globals
     "base_dir",
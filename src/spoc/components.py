@@ -9,8 +9,12 @@ components in the application.
 import functools
 from typing import Any
 
+from .importer.frozendict import FrozenDict
 from .importer.types import Info
 
+# Shared (read-only) default for `config` & `metadata`
+EMPTY: Any = FrozenDict()
+
 
 def component(
     obj: Any = None,
@@ -43,14 +47,17 @@ def component(
     ```
     """
 
-    config = config or {}
-    metadata = metadata or {}
+    config = config or EMPTY
+    metadata = metadata or EMPTY
     if obj is None:
-        return functools.partial(
-            component,
-            config=config,
-            metadata=metadata,
-        )
+        # Built once, and shared by every object the decorator is applied to
+        info = Info(config=config, metadata=metadata)
+
+        def decorator(item: Any) -> Any:
+            item.__spoc__ = info
+            return item
+
+        return decorator
 
     # Real Wrapper
     obj.__spoc__ = Info(config=config, metadata=metadata)
@@ -80,12 +87,13 @@ def is_component(obj: Any, metadata: dict) -> bool:
     ```
     """
 
-    item = obj
-    if hasattr(obj, "object") and hasattr(obj.object, "__spoc__"):
-        item = obj.object
-    if not hasattr(item, "__spoc__"):
+    info = getattr(getattr(obj, "object", None), "__spoc__", None)
+    if info is None:
+        info = getattr(obj, "__spoc__", None)
+    if info is None:
         return False
-    return item.__spoc__.metadata == metadata  # type: ignore
+    # Registered components share their type's metadata (identity first)
+    return info.metadata is metadata or info.metadata == metadata
 
 
 class Components:
@@ -106,6 +114,7 @@ class Components:
         Initialize a Component instance.
         """
         self._components: Any = {}
+        self._decorators: dict[str, Any] = {}
         for name in names:
             self.add(name)
 
@@ -122,7 +131,11 @@ class Components:
         """
         type_name = name.lower()
         meta = metadata or {}
-        self._components[type_name] = {**meta, "type": type_name}
+        # Merged once, and shared (read-only) by every registered component
+        self._components[type_name] = FrozenDict({**meta, "type": type_name})
+        self._decorators[type_name] = functools.partial(
+            component, metadata=self._components[type_name]
+        )
 
     def register(self, name: str, obj: Any, config: dict | None = None) -> None:
         """
@@ -138,7 +151,7 @@ class Components:
         components.register("command", my_obj, config={"setting": "value"})
         ```
         """
-        component(obj, config=config, metadata=self._components[name.lower()])
+        self._decorators[name.lower()](obj, config=config)
 
     def is_component(self, name: str, obj: Any) -> bool:
         """
@@ -8,6 +8,7 @@ Framework:
     - TOML files
 """
 
+import importlib.util
 import os
 import pathlib
 from typing import Any, Dict, List, Optional, Tuple
@@ -23,14 +24,15 @@ from .inject import (
 )
 from .singleton import Singleton
 
-# Attempt to import the configuration module.
+# Methods that are not Framework Keys
+EXCLUDED_KEYS = frozenset({"init", "keys", "get_components"})
+
+# Import the configuration module (only if it exists).
 CONFIG = None
-try:
+if importlib.util.find_spec("config") is not None:
     import config  # type: ignore
 
     CONFIG = config
-except ImportError:
-    CONFIG = None
 
 if CONFIG:
     try:
@@ -94,6 +96,9 @@ if CONFIG:
         components: Dict[Any, Any] | None = None
         plugins: Dict[Any, Any] | None = None
 
+        # Components by Kind (Cache)
+        _views: Dict[str, Tuple]
+
         def init(self, modules: List | None = None) -> None:
             """
             Initialize the framework by collecting installed applications and extras.
@@ -120,20 +125,39 @@ if CONFIG:
             self.installed_apps = installed_apps
             self.components = framework.components
             self.plugins = framework.plugins
+            self._views = {}
 
             # Change Dir
             os.chdir(BASE_DIR)
 
+        def get_components(self, kind: str) -> Tuple:
+            """
+            Get the components of a given `kind` (module) as a cached tuple.
+
+            Args:
+                kind (str): The module name (e.g., `"models"`, `"views"`).
+            """
+            views = self._views.get(kind)
+            if views is None:
+                group = getattr(self.components, kind, None) or {}
+                views = self._views[kind] = tuple(group.values())
+            return views
+
+        # Framework Keys (Cache)
+        _keys: Tuple | None = None
+
         @classmethod
         def get_keys(cls):
-            """Collect Framework Keys."""
-            return sorted(
-                [
-                    x
-                    for x in dir(cls)
-                    if not x.startswith("_") and x not in ["init", "keys"]
-                ]
-            )
+            """Collect Framework Keys (computed once per class)."""
+            if cls.__dict__.get("_keys") is None:
+                cls._keys = tuple(
+                    sorted(
+                        x
+                        for x in dir(cls)
+                        if not x.startswith("_") and x not in EXCLUDED_KEYS
+                    )
+                )
+            return list(cls._keys)
 
         @staticmethod
         def keys() -> Tuple:
@@ -3,8 +3,11 @@
 Auto-Importer
 """
 
+import functools
 import importlib
+import importlib.util
 import pkgutil
+import sys
 from pkgutil import ModuleInfo
 from types import ModuleType
 from typing import Any, Iterator
@@ -15,6 +18,16 @@ from .types import Core, Definition
 
 # from collections.abc import Iterator
 
+# Results of `iter_namespace` => (package name, package path)
+NAMESPACE_CACHE: dict[tuple, list[ModuleInfo]] = {}
+
+
+def clear_cache() -> None:
+    """Forget the cached scans & lookups (e.g., after installing or reloading apps)."""
+    NAMESPACE_CACHE.clear()
+    search_object.cache_clear()
+    split_plugin_path.cache_clear()
+
 
 def iter_namespace(ns_pkg: ModuleType) -> Iterator[ModuleInfo]:
     """
@@ -26,10 +39,19 @@ def iter_namespace(ns_pkg: ModuleType) -> Iterator[ModuleInfo]:
     Returns:
         Iterator[ModuleInfo]: An iterator over module information in the namespace package.
 
+    Note:
+        The directory scan is cached per package, see `clear_cache`.
+
     Reference:
         https://packaging.python.org/en/latest/guides/creating-and-discovering-plugins/
     """
-    return pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
+    key = (ns_pkg.__name__, tuple(ns_pkg.__path__))
+    found = NAMESPACE_CACHE.get(key)
+    if found is None:
+        found = NAMESPACE_CACHE[key] = list(
+            pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + ".")
+        )
+    return iter(found)
 
 
 def import_module(single_app: str) -> ModuleType | None:
@@ -43,8 +65,11 @@ def import_module(single_app: str) -> ModuleType | None:
         module or None: The imported module if found; otherwise, None.
     """
     try:
-        module = importlib.import_module(single_app)
-    except Exception:
+        module = sys.modules.get(single_app)
+        # Missing apps are detected without raising (and catching) an ImportError
+        if module is None and importlib.util.find_spec(single_app) is not None:
+            module = importlib.import_module(single_app)
+    except ImportError:
         module = None
     return module
 
@@ -62,16 +87,35 @@ def import_modules(all_apps: list) -> dict:
     Reference:
         https://packaging.python.org/en/latest/guides/creating-and-discovering-plugins/
     """
-    installed_apps = {}
+    plugin_names = []
     for app in all_apps:
         module = import_module(app)
         if module:
-            discovered_plugins = {
-                name: importlib.import_module(name)
+            # Interned: reused as keys by `installed_apps` and `split_plugin_path`
+            plugin_names.extend(
+                sys.intern(name)
                 for finder, name, ispkg in iter_namespace(module)
-            }
-            installed_apps.update(discovered_plugins)
-    return installed_apps
+            )
+
+    # Serial & in order: plugins may rely on the main thread (e.g., `signal.signal`)
+    discovered_plugins = [importlib.import_module(name) for name in plugin_names]
+
+    return dict(zip(plugin_names, discovered_plugins))
+
+
+@functools.lru_cache(maxsize=512)
+def split_plugin_path(plugin_path: str) -> tuple[str, str]:
+    """
+    Split a plugin path into its `app` and `module` names.
+
+    Args:
+        plugin_path (str): The dotted path of the plugin (e.g., `"demo.views"`).
+
+    Returns:
+        tuple[str, str]: The `app` and `module` names (`module` is empty if missing).
+    """
+    app_name, _, app_submodules = plugin_path.partition(".")
+    return sys.intern(app_name), sys.intern(app_submodules.partition(".")[0])
 
 
 def get_modules(modules: list, apps: list) -> Core:
@@ -86,31 +130,31 @@ def get_modules(modules: list, apps: list) -> Core:
         Core: A Core object containing the discovered modules and organized plugins.
     """
     plugin_dict: Any = {key: [] for key in modules}
+    wanted_modules = frozenset(modules)
     installed_apps = import_modules(apps)
 
     for app_path, module_setup in installed_apps.items():
-        uri_parts = app_path.split(".")
-        app_name = uri_parts[0]
-        app_module = None
-        if len(uri_parts) > 1:
-            app_module = uri_parts[1]
-        if app_module and app_module in modules:
-            current_fields = {}
-            for field in get_fields(module_setup):
-                current_node = get_attr(module_setup, field)
-                if current_node is not None:
-                    current_fields[field] = current_node
-            plugin: Definition = Definition(
-                path=app_path,
-                app=app_name,
-                module=app_module,
-                fields=FrozenDict(current_fields),
-            )
-            plugin_dict[app_module].append(plugin)
+        app_name, app_module = split_plugin_path(app_path)
+        if not app_module or app_module not in wanted_modules:
+            continue
+        # Listed (`dir`) but not gettable (e.g., a lazy `__getattr__`) => skipped
+        current_fields = {
+            field: node
+            for field in get_fields(module_setup)
+            if (node := getattr(module_setup, field, None)) is not None
+        }
+        plugin: Definition = Definition(
+            path=app_path,
+            app=app_name,
+            module=app_module,
+            fields=FrozenDict(current_fields),
+        )
+        plugin_dict[app_module].append(plugin)
 
     return Core(modules=installed_apps, components=plugin_dict)
 
 
+@functools.lru_cache(maxsize=1024)
 def search_object(dotted_path: str) -> Any:
     """
     Search for an `object` within a module using a dotted path notation.
@@ -126,11 +170,12 @@ def search_object(dotted_path: str) -> Any:
     ```python
     spoc.search_object("demo.middleware.on_event")
     ```
+
+    Note:
+        Results are cached per `dotted_path`, see `clear_cache`.
     """
     parts = dotted_path.split(".")
     root = parts[0]
     module = import_module(root)
     import_modules([root])
-    for part in parts[1:]:
-        module = get_attr(module, part)
-    return module
+    return functools.reduce(get_attr, parts[1:], module)
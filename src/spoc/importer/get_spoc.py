@@ -8,7 +8,6 @@ from dataclasses import make_dataclass
 from typing import Any
 
 from .frozendict import FrozenDict
-from .tools import get_attr
 from .types import Object
 
 
@@ -36,10 +35,10 @@ def get_spoc_components(plugins: dict) -> Any:
 
         for current in module_list:
             for current_module, active_class in current.fields.items():
-                metadata = get_attr(active_class, "__spoc__")
+                metadata = getattr(active_class, "__spoc__", None)
 
                 # Spoc Plugin(s)
-                if metadata and get_attr(metadata, "is_spoc"):
+                if metadata and getattr(metadata, "is_spoc", None):
                     module_uri = f"{current.app}.{current_module.lower()}"
                     global_uri = f"{current.module}.{module_uri}"
                     # Create Object
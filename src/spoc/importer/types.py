@@ -15,7 +15,7 @@ import dataclasses as dc
 import typing
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class Info:
     """Spoc Component Info"""
 
@@ -24,7 +24,7 @@ class Info:
     is_spoc: bool = True
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class Object:
     """Framework Object"""
 
@@ -37,7 +37,7 @@ class Object:
     info: Info | None = None
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class Core:
     """Framework Core"""
 
@@ -45,7 +45,7 @@ class Core:
     components: dict
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class Definition:
     """Framework Definitions"""
 
@@ -55,7 +55,7 @@ class Definition:
     fields: dict[str, typing.Any]
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class App:
     """Framework App"""
 
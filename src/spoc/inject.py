@@ -7,6 +7,7 @@ This module provides functionality for collecting and injecting
 
 """
 
+import os
 import pathlib
 import sys
 from typing import Any
@@ -17,6 +18,13 @@ from .toml_core import TOML
 
 DEFAULT_MODE = "development"
 
+# Mode => App Groups (in order)
+MODE_SOURCES: dict[str, tuple[str, ...]] = {
+    "production": ("production",),
+    "staging": ("production", "staging"),
+    "development": ("production", "staging", "development"),
+}
+
 
 def inject_apps_folder(base_dir: pathlib.Path) -> None:
     """Inject the apps directory into the Python path.
@@ -27,12 +35,14 @@ def inject_apps_folder(base_dir: pathlib.Path) -> None:
     Args:
         base_dir (pathlib.Path): The base directory where the `apps` folder will be injected.
     """
-    base_apps = base_dir / "apps"
-    base_apps.mkdir(parents=True, exist_ok=True)
+    base_apps = os.path.join(os.fspath(base_dir), "apps")
+
+    # Raises if it can't be created, so it always exists afterwards
+    os.makedirs(base_apps, exist_ok=True)
 
-    if base_apps.exists():
-        sys.path.insert(0, str(base_apps))
-        # sys.path.insert(0, os.path.join(base_dir, "apps"))
+    # Only once, repeated injections would keep growing `sys.path`
+    if base_apps not in sys.path:
+        sys.path.insert(0, base_apps)
 
 
 def collect_apps_partial(app_mode: str, the_apps: dict) -> list:
@@ -47,20 +57,11 @@ def collect_apps_partial(app_mode: str, the_apps: dict) -> list:
     Returns:
         list: A list of installed apps corresponding to the specified mode.
     """
-    installed_apps = []
-
-    match app_mode:
-        case "production":
-            installed_apps.extend(the_apps.get("production", []))
-        case "staging":  # production + staging
-            installed_apps.extend(the_apps.get("production", []))
-            installed_apps.extend(the_apps.get("staging", []))
-        case "development":  # production + staging + development
-            installed_apps.extend(the_apps.get("production", []))
-            installed_apps.extend(the_apps.get("staging", []))
-            installed_apps.extend(the_apps.get("development", []))
-
-    return installed_apps
+    return [
+        app
+        for source in MODE_SOURCES.get(app_mode, ())
+        for app in the_apps.get(source, ())
+    ]
 
 
 def collect_installed_apps(toml_dir: dict, settings: Any = None) -> list:
@@ -89,13 +90,13 @@ def collect_installed_apps(toml_dir: dict, settings: Any = None) -> list:
     return list(set(installed_apps))
 
 
-def get_toml_file(toml_file: pathlib.Path) -> frozendict:
+def get_toml_file(toml_file: str | os.PathLike) -> frozendict:
     """Load a TOML file into a frozendict.
 
     Reads and parses a TOML file into a `frozendict` object.
 
     Args:
-        toml_file (pathlib.Path): The path to the TOML file.
+        toml_file (str | os.PathLike): The path to the TOML file.
 
     Returns:
         frozendict: A frozendict containing the parsed TOML file data,
@@ -103,9 +104,10 @@ def get_toml_file(toml_file: pathlib.Path) -> frozendict:
     """
     manager = TOML(toml_file)
 
-    if toml_file.exists():
+    try:
         return frozendict(**manager.read())
-    return frozendict({})
+    except FileNotFoundError:
+        return frozendict({})
 
 
 def get_toml_files(base_dir: pathlib.Path) -> dict:
@@ -119,9 +121,10 @@ def get_toml_files(base_dir: pathlib.Path) -> dict:
     Returns:
         dict: A dictionary with keys 'spoc' and 'pyproject' pointing to their respective TOML files.
     """
+    base = os.fspath(base_dir)
     return {
-        "spoc": get_toml_file(base_dir / "config" / "spoc.toml"),
-        "pyproject": get_toml_file(base_dir / "pyproject.toml"),
+        "spoc": get_toml_file(os.path.join(base, "config", "spoc.toml")),
+        "pyproject": get_toml_file(os.path.join(base, "pyproject.toml")),
     }
 
 
@@ -194,7 +197,7 @@ def load_envs(base_dir: pathlib.Path, mode: str) -> frozendict:
         If the file does not exist or is empty, an empty frozendict is returned.
     """
     # File-Env by Mode
-    file_path = base_dir / "config" / ".env" / f"{mode}.toml"
+    file_path = os.path.join(os.fspath(base_dir), "config", ".env", f"{mode}.toml")
 
     # Load the TOML file and return the 'env' section as a frozendict
     env_data = get_toml_file(file_path).get("env", {})
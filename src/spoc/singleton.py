@@ -3,6 +3,7 @@
 Tool for Singleton(s)
 """
 
+import threading
 from typing import Any
 
 
@@ -13,12 +14,40 @@ class Singleton:
 
     init: Any
 
+    # Guards the creation of the per-class locks (never held during `init`)
+    _locks_lock = threading.Lock()
+
     def __new__(cls, *args, **kwargs):
         it_id = "__it__"
         it = cls.__dict__.get(it_id, None)
         if it is not None:
             return it
-        it = object.__new__(cls)
-        setattr(cls, it_id, it)
-        it.init(*args, **kwargs)
+        # Re-entrant: `init` may call its own class again (from the same thread)
+        with cls._class_lock():
+            it = cls.__dict__.get(it_id, None)
+            if it is not None:
+                return it
+            it = cls.__dict__.get("__initializing__", None)
+            if it is not None:
+                return it
+            it = object.__new__(cls)
+            setattr(cls, "__initializing__", it)
+            try:
+                it.init(*args, **kwargs)
+            finally:
+                delattr(cls, "__initializing__")
+            # Published only once it's fully initialized
+            setattr(cls, it_id, it)
         return it
+
+    @classmethod
+    def _class_lock(cls) -> Any:
+        """Get (or create) the lock of this exact `class`."""
+        lock = cls.__dict__.get("__lock__", None)
+        if lock is None:
+            with Singleton._locks_lock:
+                lock = cls.__dict__.get("__lock__", None)
+                if lock is None:
+                    lock = threading.RLock()
+                    setattr(cls, "__lock__", lock)
+        return lock
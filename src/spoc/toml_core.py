@@ -4,15 +4,15 @@
 Tool for handling TOML files
 """
 
+import os
 import tomllib
-from pathlib import Path
 from typing import Any, Dict
 
 
 class TOML:
     """A wrapper class for managing TOML files."""
 
-    def __init__(self, file: Path):
+    def __init__(self, file: str | os.PathLike):
         """
         Initialize the TOML manager with the given file path.
         """
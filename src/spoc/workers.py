@@ -214,9 +214,10 @@ class BaseServer(ABC):
     ```python
     import time
 
-    class MyProcess(spoc.BaseProcess):  # BaseThread
+    # IO-bound worker => `BaseThread` (use `BaseProcess` for CPU-bound work)
+    class MyThread(spoc.BaseThread):
         def on_event(self, event_type):
-            print("Process | Thread:", event_type)
+            print("Thread:", event_type)
 
         def server(self):
             while self.active:
@@ -229,8 +230,8 @@ class BaseServer(ABC):
             print("Server:", event_type)
 
     # Press (CTRL + C) to Quit
-    MyServer.add(MyProcess(name="One"))
-    MyServer.add(MyProcess(name="Two"))
+    MyServer.add(MyThread(name="One"))
+    MyServer.add(MyThread(name="Two"))
     MyServer.start()
     ```
     """
@@ -311,6 +312,87 @@ class BaseServer(ABC):
                 cls.on_event("before_shutdown")
                 cls.stop(force_stop=True, timeout=timeout, forced_delay=forced_delay)
 
+    @classmethod
+    def gather(cls) -> None:
+        """
+        Run all added workers on a **single** event loop in the current process.
+
+        Async workers (`async def server`) become tasks on one shared loop, instead
+        of a thread (or process) with its own loop each. Sync workers each get a
+        dedicated thread. Use `start` for CPU-bound `BaseProcess` workers.
+
+        Note:
+            The loop is always created with `asyncio.run`, so a worker's `agent` is
+            ignored. Set a loop policy in `before` instead (e.g., `uvloop`).
+
+        Example:
+
+        ```python
+        MyServer.add(AsyncThread(name="One"), AsyncThread(name="Two"))
+        MyServer.gather()  # Press (CTRL + C) to Quit
+        ```
+        """
+        # Ensure `on_event`
+        if not hasattr(cls, "on_event"):
+            raise MethodNotFoundError(
+                cls.__name__,
+                "on_event",
+                "staticmethod or classmethod",
+            )
+
+        # Startup
+        cls.on_event("startup")
+
+        # Main PID
+        cls.all_pids.add(os.getpid())
+
+        # Setup (Async Workers)
+        for worker in cls.workers:
+            if inspect.iscoroutinefunction(worker.server):
+                worker.before()
+
+        # Loop Until (Keyboard-Interrupt) or all Workers are stopped
+        try:
+            asyncio.run(cls._gather_workers())
+        except KeyboardInterrupt:
+            pass
+
+        # Shutdown
+        cls.on_event("shutdown")
+
+    @classmethod
+    async def _gather_workers(cls) -> None:
+        """Run the workers concurrently, and stop them all once cancelled."""
+        # Deferred: `concurrent.futures` pulls in `logging` at `import spoc` time
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        is_async = [
+            inspect.iscoroutinefunction(worker.server) for worker in cls.workers
+        ]
+        # One thread per sync worker (each one holds its thread until stopped)
+        pool = ThreadPoolExecutor(max_workers=max(1, is_async.count(False)))
+        jobs = asyncio.gather(
+            *(
+                (
+                    worker.run_async()
+                    if run_async
+                    else loop.run_in_executor(pool, worker.run)
+                )
+                for worker, run_async in zip(cls.workers, is_async)
+            )
+        )
+        try:
+            await asyncio.shield(jobs)
+        except asyncio.CancelledError:
+            # Before Shutdown
+            cls.on_event("before_shutdown")
+            for worker in cls.workers:
+                worker.stop()
+            await jobs
+        finally:
+            pool.shutdown(wait=False)
+
     @classmethod
     def stop(
         cls, timeout: int = 5, force_stop: bool = False, forced_delay: int = 1
@@ -0,0 +1,5 @@
+"""Not a framework module (only imported for its side effects)."""
+
+import threading
+
+IMPORTED_ON = threading.current_thread().name
@@ -4,6 +4,8 @@ import asyncio
 import functools
 import pathlib
 import sys
+import threading
+import time
 import pytest
 
 pytest_plugins = ("pytest_asyncio",)
@@ -68,5 +70,119 @@ def test_framework_components(spoc, app):
     assert list(app.components.__dict__.keys()) == ["commands", "models", "views"]
 
 
+def test_framework_get_components(spoc, app):
+    framework = spoc.init()
+    commands = framework.get_components("commands")
+    assert commands == tuple(app.components.commands.values())
+    assert framework.get_components("commands") is commands
+    assert framework.get_components("missing") == ()
+    assert "get_components" not in framework.get_keys()
+
+
+def test_framework_imports_all_app_modules(spoc, app):
+    from spoc.importer.base import get_modules
+
+    # Modules outside `modules` are still imported, on the calling thread
+    core = get_modules(["views"], ["demo"])
+    assert "demo.signals" in core.modules
+    assert core.modules["demo.signals"].IMPORTED_ON == threading.main_thread().name
+
+
 def test_framework_plugins(spoc, app):
     assert list(app.plugins.keys()) == ["on_startup", "middleware", "on_shutdown"]
+
+
+def test_singleton_concurrency(spoc):
+    calls = []
+
+    class Slow(spoc.Base):
+        def init(self):
+            calls.append(self)
+            # Re-entrant: the instance being initialized
+            assert Slow() is self
+            time.sleep(0.05)
+            self.ready = True
+
+    class Other(spoc.Base):
+        def init(self):
+            # Another singleton, created from another thread while this one initializes
+            worker = threading.Thread(target=Inner)
+            worker.start()
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+
+    class Inner(spoc.Base):
+        def init(self):
+            pass
+
+    found = []
+    threads = [
+        threading.Thread(target=lambda: found.append(Slow().ready)) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    Other()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert found == [True] * 8
+
+
+def test_server_gather(spoc):
+    events = []
+
+    class Worker(spoc.BaseThread):
+        async def on_event(self, event_type):
+            events.append(f"{self.options.name}:{event_type}")
+
+        async def server(self):
+            self.stop()
+
+    class Server(spoc.BaseServer):
+        @staticmethod
+        def on_event(event_type):
+            events.append(f"server:{event_type}")
+
+    Server.add(Worker(name="one"), Worker(name="two"))
+    Server.gather()
+    Server.clear()
+
+    assert events[0] == "server:startup"
+    assert events[-1] == "server:shutdown"
+    assert sorted(events[1:-1]) == [
+        "one:shutdown",
+        "one:startup",
+        "two:shutdown",
+        "two:startup",
+    ]
+
+
+def test_server_gather_sync_workers(spoc):
+    # More sync workers than the loop's default executor has threads
+    count = 40
+    barrier = threading.Barrier(count, timeout=5)
+    passed = []
+
+    class Worker(spoc.BaseThread):
+        def on_event(self, event_type):
+            pass
+
+        def server(self):
+            try:
+                barrier.wait()
+                passed.append(self)
+            except threading.BrokenBarrierError:
+                pass
+            self.stop()
+
+    class Server(spoc.BaseServer):
+        @staticmethod
+        def on_event(event_type):
+            pass
+
+    Server.add(*(Worker() for _ in range(count)))
+    Server.gather()
+    Server.clear()
+
+    assert len(passed) == count